@@ -0,0 +1,99 @@
+"""Optional accelerated kernels for building mesh topology.
+
+If the optional dependency ``numba`` is installed, :class:`~skfem.mesh.Mesh`
+uses these kernels inside ``build_entities`` and ``build_inverse`` to
+deduplicate the packed entity keys and to find the elements-per-entity in
+a single pass.  Otherwise, the pure NumPy implementations are used.
+
+"""
+import numpy as np
+
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def wrapper(fun):
+            return fun
+        return wrapper
+
+
+@njit('Tuple((int64[:, ::1], int64[::1]))(int64[:, ::1], int64)',
+      cache=True)
+def sort_and_pack(indexing, nvertices):
+    """Sort entity vertices columnwise and pack them into int64 keys.
+
+    The sorted column and its packed int64 key are produced in the same
+    pass; an insertion sort suffices because entities have at most a
+    dozen vertices.
+
+    """
+    nrows, ncols = indexing.shape
+    sorted_indexing = np.empty((nrows, ncols), dtype=np.int64)
+    keys = np.empty(ncols, dtype=np.int64)
+    for j in range(ncols):
+        for i in range(nrows):
+            sorted_indexing[i, j] = indexing[i, j]
+        for i in range(1, nrows):
+            v = sorted_indexing[i, j]
+            k = i - 1
+            while k >= 0 and sorted_indexing[k, j] > v:
+                sorted_indexing[k + 1, j] = sorted_indexing[k, j]
+                k -= 1
+            sorted_indexing[k + 1, j] = v
+        key = sorted_indexing[0, j]
+        for i in range(1, nrows):
+            key = key * nvertices + sorted_indexing[i, j]
+        keys[j] = key
+    return sorted_indexing, keys
+
+
+@njit('UniTuple(int64[::1], 2)(int64[::1])', cache=True)
+def unique_packed(keys):
+    """Drop-in for 1D ``np.unique`` with index and inverse on packed keys.
+
+    Performs a single stable argsort of the keys and then recovers the
+    unique values, the first occurrences and the inverse mapping in one
+    walk over the sorted order.
+
+    """
+    n = keys.shape[0]
+    order = np.argsort(keys, kind='mergesort')
+    ixa = np.empty(n, dtype=np.int64)
+    ixb = np.empty(n, dtype=np.int64)
+    nunique = 0
+    prev = keys[order[0]] + 1 if n > 0 else np.int64(0)
+    for itr in range(n):
+        jtr = order[itr]
+        if keys[jtr] != prev:
+            ixa[nunique] = jtr
+            nunique += 1
+            prev = keys[jtr]
+        ixb[jtr] = nunique - 1
+    return ixa[:nunique], ixb
+
+
+@njit('int64[:, ::1](int64[:, ::1], int64)', cache=True)
+def build_inverse_packed(mapping, nentities):
+    """Find the first and the last element sharing each entity."""
+    nrows, nelems = mapping.shape
+    inverse = np.zeros((2, nentities), dtype=np.int64)
+    seen = np.zeros(nentities, dtype=np.bool_)
+    for itr in range(nrows):
+        for jtr in range(nelems):
+            k = mapping[itr, jtr]
+            if not seen[k]:
+                inverse[0, k] = jtr
+                seen[k] = True
+            inverse[1, k] = jtr
+    for k in range(nentities):
+        if inverse[0, k] == inverse[1, k]:
+            inverse[1, k] = -1
+    return inverse
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, replace
+from functools import cached_property
 from typing import Callable, Dict, List, Optional, Tuple, Type, Union
 from warnings import warn
 
@@ -6,6 +7,8 @@ import numpy as np
 from numpy import ndarray
 
 from ..element import BOUNDARY_ELEMENT_MAP, Element
+from ._topology import (HAS_NUMBA, build_inverse_packed, sort_and_pack,
+                        unique_packed)
 
 
 @dataclass(repr=False)
@@ -31,16 +34,24 @@ class Mesh:
     # off this behaviour and, hence, this flag exists.
     sort_t: bool = False
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # freeze the class-level default arrays; every instance gets a
+        # writable copy in __post_init__ so that in-place edits cannot
+        # corrupt the defaults shared by meshes constructed later
+        for key in ('doflocs', 't'):
+            default = cls.__dict__.get(key)
+            if isinstance(default, np.ndarray):
+                default.flags.writeable = False
+
     @property
     def p(self):
         return self.doflocs
 
-    @property
+    @cached_property
     def dofs(self):
         from skfem.assembly import Dofs
-        if not hasattr(self, '_dofs'):
-            self._dofs = Dofs(self, self.elem())
-        return self._dofs
+        return Dofs(self, self.elem())
 
     @property
     def refdom(self):
@@ -62,7 +73,9 @@ class Mesh:
 
     @property
     def nvertices(self):
-        return np.max(self.t) + 1
+        if self._nvertices is None:
+            self._nvertices = np.max(self.t) + 1
+        return self._nvertices
 
     @property
     def nfacets(self):
@@ -84,61 +97,61 @@ class Mesh:
     def boundaries(self):
         return self._boundaries
 
-    @property
+    @cached_property
     def facets(self):
-        if not hasattr(self, '_facets'):
-            self._init_facets()
-        return self._facets
+        self._init_facets()
+        return self.facets
 
-    @property
+    @cached_property
     def t2f(self):
-        if not hasattr(self, '_t2f'):
-            self._init_facets()
-        return self._t2f
+        self._init_facets()
+        return self.t2f
 
-    @property
+    @cached_property
     def f2t(self):
-        if not hasattr(self, '_f2t'):
-            self._f2t = self.build_inverse(self.t, self.t2f)
-        return self._f2t
+        return self.build_inverse(self.t, self.t2f, self.nfacets)
 
-    @property
+    @cached_property
     def edges(self):
-        if not hasattr(self, '_edges'):
-            self._init_edges()
-        return self._edges
+        self._init_edges()
+        return self.edges
 
-    @property
+    @cached_property
     def t2e(self):
-        if not hasattr(self, '_t2e'):
-            self._init_edges()
-        return self._t2e
+        self._init_edges()
+        return self.t2e
 
     def dim(self):
-        return self.elem.refdom.dim()
+        return self._dim
+
+    @cached_property
+    def _boundary_facets(self):
+        return np.nonzero(self.f2t[1] == -1)[0]
 
     def boundary_facets(self) -> ndarray:
         """Return an array of boundary facet indices."""
-        return np.nonzero(self.f2t[1] == -1)[0]
+        return self._boundary_facets
 
-    def boundary_edges(self) -> ndarray:
-        """Return an array of boundary edge indices."""
+    @cached_property
+    def _boundary_edges(self):
         facets = self.boundary_facets()
-        boundary_edges = np.sort(np.hstack(
-            tuple([np.vstack((self.facets[itr, facets],
-                              self.facets[(itr + 1) % self.facets.shape[0],
-                              facets]))
-                   for itr in range(self.facets.shape[0])])).T, axis=1)
+        # edges of a facet connect consecutive vertices of the facet
+        a = self.facets[:, facets]
+        b = np.roll(a, -1, axis=0)
+        boundary_edges = np.sort(np.stack((a.ravel(), b.ravel()), axis=1),
+                                 axis=1)
         edge_candidates = np.unique(self.t2e[:, self.f2t[0, facets]])
         A = self.edges[:, edge_candidates].T
         B = boundary_edges
-        dims = A.max(0) + 1
-        ix = np.where(np.in1d(
-            np.ravel_multi_index(A.T, dims),  # type: ignore
-            np.ravel_multi_index(B.T, dims),  # type: ignore
-        ))[0]
+        # pack the sorted vertex pairs into single int64 keys for matching
+        ix = np.nonzero(np.isin((A[:, 0] << 32) + A[:, 1],
+                                (B[:, 0] << 32) + B[:, 1]))[0]
         return edge_candidates[ix]
 
+    def boundary_edges(self) -> ndarray:
+        """Return an array of boundary edge indices."""
+        return self._boundary_edges
+
     def with_boundaries(self,
                         boundaries: Dict[str, Callable[[ndarray], ndarray]],
                         boundaries_only: bool = True):
@@ -248,14 +261,23 @@ class Mesh:
 
         return boundaries, subdomains
 
+    @cached_property
+    def _boundary_nodes(self):
+        return np.unique(self.facets[:, self.boundary_facets()])
+
     def boundary_nodes(self) -> ndarray:
         """Return an array of boundary node indices."""
-        return np.unique(self.facets[:, self.boundary_facets()])
+        return self._boundary_nodes
+
+    @cached_property
+    def _interior_nodes(self):
+        mask = np.ones(self.p.shape[1], dtype=bool)
+        mask[self.boundary_nodes()] = False
+        return np.flatnonzero(mask)
 
     def interior_nodes(self) -> ndarray:
         """Return an array of interior node indices."""
-        return np.setdiff1d(np.arange(0, self.p.shape[1]),
-                            self.boundary_nodes())
+        return self._interior_nodes
 
     def nodes_satisfying(self,
                          test: Callable[[ndarray], ndarray],
@@ -290,9 +312,8 @@ class Mesh:
             If ``True``, include only boundary facets.
 
         """
-        midp = [np.sum(self.p[itr, self.facets], axis=0) / self.facets.shape[0]
-                for itr in range(self.dim())]
-        facets = np.nonzero(test(np.array(midp)))[0]
+        midp = self.p[:, self.facets].mean(axis=1)
+        facets = np.nonzero(test(midp))[0]
         if boundaries_only:
             facets = np.intersect1d(facets, self.boundary_facets())
         return facets
@@ -308,9 +329,8 @@ class Mesh:
             are to be included in the return set.
 
         """
-        midp = [np.sum(self.p[itr, self.t], axis=0) / self.t.shape[0]
-                for itr in range(self.dim())]
-        return np.nonzero(test(np.array(midp)))[0]
+        midp = self.p[:, self.t].mean(axis=1)
+        return np.nonzero(test(midp))[0]
 
     def _expand_facets(self, ix: ndarray) -> Tuple[ndarray, ndarray]:
         """Return vertices and edges corresponding to given facet indices.
@@ -354,16 +374,18 @@ class Mesh:
 
     def _init_facets(self):
         """Initialize ``self.facets``."""
-        self._facets, self._t2f = self.build_entities(
+        self.facets, self.t2f = self.build_entities(
             self.t,
             self.elem.refdom.facets,
+            nvertices=self.nvertices,
         )
 
     def _init_edges(self):
         """Initialize ``self.edges``."""
-        self._edges, self._t2e = self.build_entities(
+        self.edges, self.t2e = self.build_entities(
             self.t,
             self.elem.refdom.edges,
+            nvertices=self.nvertices,
         )
 
     def __post_init__(self):
@@ -377,12 +399,20 @@ class Mesh:
         ``self.doflocs`` and changing the indices in ``self.t``.
 
         """
+        self._nvertices = None
+        self._dim = self.elem.refdom.dim()
+
         if self.sort_t:
             self.t = np.sort(self.t, axis=0)
 
         self.doflocs = np.asarray(self.doflocs, dtype=np.float64, order="K")
         self.t = np.asarray(self.t, dtype=np.int64, order="K")
 
+        if not self.doflocs.flags['WRITEABLE']:
+            self.doflocs = self.doflocs.copy()
+        if not self.t.flags['WRITEABLE']:
+            self.t = self.t.copy()
+
         M = self.elem.refdom.nnodes
 
         if self.nnodes > M:
@@ -562,16 +592,21 @@ class Mesh:
 
         mapping = mesh._mapping()
         nelem = cls.elem
-        dofs = Dofs(mesh, nelem())
+
+        # dof numbering depends only on the element type and the (fixed)
+        # connectivity of the source mesh; reuse it on repeated upgrades
+        if not hasattr(mesh, '_elem_dofs'):
+            mesh._elem_dofs = {}
+        if nelem not in mesh._elem_dofs:
+            mesh._elem_dofs[nelem] = Dofs(mesh, nelem())
+        dofs = mesh._elem_dofs[nelem]
         locs = mapping.F(nelem.doflocs.T)
         doflocs = np.zeros((locs.shape[0], dofs.N))
 
         assert dofs.element_dofs is not None
 
         # match mapped dofs and global dof numbering
-        for itr in range(locs.shape[0]):
-            for jtr in range(dofs.element_dofs.shape[0]):
-                doflocs[itr, dofs.element_dofs[jtr]] = locs[itr, :, jtr]
+        doflocs[:, dofs.element_dofs] = locs.transpose(0, 2, 1)
 
         return cls(
             doflocs=doflocs,
@@ -613,11 +648,14 @@ class Mesh:
         if isinstance(factors, float):
             # for backwards compatibility
             factors = self.doflocs.shape[0] * [factors]
-        return replace(
+        factors = np.asarray(factors, dtype=self.doflocs.dtype)
+        if factors.ndim == 1:
+            # per-dimension factors broadcast over the nodes
+            factors = factors[:, None]
+        return self._share_topology(replace(
             self,
-            doflocs=np.array([self.doflocs[itr] * factors[itr]
-                              for itr in range(len(factors))]),
-        )
+            doflocs=self.doflocs * factors,
+        ))
 
     def translated(self, diffs):
         """Return a new translated mesh.
@@ -629,11 +667,27 @@ class Mesh:
             dimension.
 
         """
-        return replace(
+        diffs = np.asarray(diffs, dtype=self.doflocs.dtype)
+        if diffs.ndim == 1:
+            # per-dimension offsets broadcast over the nodes
+            diffs = diffs[:, None]
+        return self._share_topology(replace(
             self,
-            doflocs=np.array([self.doflocs[itr] + diffs[itr]
-                              for itr in range(len(diffs))]),
-        )
+            doflocs=self.doflocs + diffs,
+        ))
+
+    def _share_topology(self, target):
+        """Copy cached topology to a mesh with identical connectivity.
+
+        The dof numbering and the lower dimensional entities depend only
+        on ``t``, so transformations that touch ``doflocs`` alone can
+        pass the already computed caches on to the result.
+
+        """
+        for key in ('facets', 't2f', 'f2t', 'edges', 't2e', 'dofs'):
+            if key in self.__dict__:
+                target.__dict__[key] = self.__dict__[key]
+        return target
 
     def mirrored(self,
                  normal: Tuple[float, ...],
@@ -711,24 +765,48 @@ class Mesh:
         if X.shape[0] == 1:
             p = np.array([x.flatten()])
         else:
-            p = x[0].flatten()
-            for itr in range(len(x) - 1):
-                p = np.vstack((p, x[itr + 1].flatten()))
+            p = x.reshape(x.shape[0], -1)
 
         return cls(p, t)
 
     @staticmethod
-    def build_entities(t, indices, sort=True):
+    def build_entities(t, indices, sort=True, nvertices=None):
         """Build low dimensional topological entities."""
         if indices is None:
             return None, None
+        if nvertices is None:
+            nvertices = np.max(t) + 1
         indexing = np.hstack(tuple([t[ix] for ix in indices]))
-        sorted_indexing = np.sort(indexing, axis=0)
 
-        sorted_indexing, ixa, ixb = np.unique(sorted_indexing,
-                                              axis=1,
-                                              return_index=True,
-                                              return_inverse=True)
+        if indexing.shape[0] * np.log2(max(nvertices, 2)) < 63:
+            # pack the sorted vertex tuples into int64 keys so that the
+            # duplicates can be resolved by a fast 1D unique; the packing
+            # preserves the lexicographic column order
+            if HAS_NUMBA:
+                sorted_indexing, keys = sort_and_pack(indexing, nvertices)
+                ixa, ixb = unique_packed(keys)
+            else:
+                sorted_indexing = np.sort(indexing, axis=0)
+                keys = sorted_indexing[0].astype(np.int64)
+                for itr in range(1, sorted_indexing.shape[0]):
+                    keys = keys * nvertices + sorted_indexing[itr]
+                _, ixa, ixb = np.unique(keys,
+                                        return_index=True,
+                                        return_inverse=True)
+            sorted_indexing = sorted_indexing[:, ixa]
+        else:
+            # too many vertices for packed keys; lexicographic sort of the
+            # columns and run detection avoid the slow structured-view
+            # code path of np.unique(..., axis=1)
+            sorted_indexing = np.sort(indexing, axis=0)
+            idx = np.lexsort(sorted_indexing[::-1])
+            sorted_indexing = sorted_indexing[:, idx]
+            mask = np.r_[True, np.any(sorted_indexing[:, 1:]
+                                      != sorted_indexing[:, :-1], axis=0)]
+            ixa = idx[mask]
+            ixb = np.empty_like(idx)
+            ixb[idx] = np.cumsum(mask) - 1
+            sorted_indexing = sorted_indexing[:, mask]
         mapping = ixb.reshape((len(indices), t.shape[1]))
 
         if sort:
@@ -737,18 +815,26 @@ class Mesh:
         return np.ascontiguousarray(indexing[:, ixa]), mapping
 
     @staticmethod
-    def build_inverse(t, mapping):
+    def build_inverse(t, mapping, nentities=None):
         """Build inverse mapping from low dimensional topological entities."""
+        if nentities is None:
+            nentities = np.max(mapping) + 1
+        if HAS_NUMBA:
+            return build_inverse_packed(np.ascontiguousarray(mapping),
+                                        nentities)
         e = mapping.flatten(order='C')
-        tix = np.tile(np.arange(t.shape[1]), (1, t.shape[0]))[0]
-
-        e_first, ix_first = np.unique(e, return_index=True)
-        e_last, ix_last = np.unique(e[::-1], return_index=True)
-        ix_last = e.shape[0] - ix_last - 1
 
-        inverse = np.zeros((2, np.max(mapping) + 1), dtype=np.int64)
-        inverse[0, e_first] = tix[ix_first]
-        inverse[1, e_last] = tix[ix_last]
+        # one stable sort gives both the first and the last occurrence
+        # of each entity as the heads and tails of the sorted runs
+        order = np.argsort(e, kind='stable')
+        e_sorted = e[order]
+        heads = np.flatnonzero(np.r_[True, e_sorted[1:] != e_sorted[:-1]])
+        tails = np.r_[heads[1:] - 1, e.shape[0] - 1]
+
+        # the element index of flat entry i is i % nelements
+        inverse = np.zeros((2, nentities), dtype=np.int64)
+        inverse[0, e_sorted[heads]] = order[heads] % t.shape[1]
+        inverse[1, e_sorted[tails]] = order[tails] % t.shape[1]
 
         inverse[1, np.nonzero(inverse[0] == inverse[1])[0]] = -1
 
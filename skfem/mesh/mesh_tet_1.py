@@ -7,6 +7,51 @@ from scipy.spatial import cKDTree
 
 from ..element import Element, ElementTetP1
 from .mesh_3d import Mesh3D
+from ._topology import HAS_NUMBA, njit, prange
+
+
+# edges of the corner tets kept in every uniform split; corner tet b
+# consists of the vertex t[b] and the midpoints of these three edges
+_CORNER_EDGES = np.array([[0, 2, 3],
+                          [0, 1, 4],
+                          [1, 2, 5],
+                          [3, 4, 5]], dtype=np.int64)
+
+# edges of the four middle tets for each choice of the middle pyramid
+# diagonal: (2, 4), (1, 3) and (0, 5)
+_MIDDLE_EDGES = np.array([[[2, 4, 0, 1],
+                           [2, 4, 0, 3],
+                           [2, 4, 1, 5],
+                           [2, 4, 3, 5]],
+                          [[1, 3, 0, 4],
+                           [1, 3, 4, 5],
+                           [1, 3, 5, 2],
+                           [1, 3, 2, 0]],
+                          [[0, 5, 1, 4],
+                           [0, 5, 4, 3],
+                           [0, 5, 3, 2],
+                           [0, 5, 2, 1]]], dtype=np.int64)
+
+
+@njit('int64[:, ::1](int64[:, ::1], int64[:, ::1], int64[::1], '
+      'int64[::1], int64[::1], int64[::1])',
+      cache=True, parallel=True)
+def _uniform_split(t, t2e, case, rank, caseoff, casecount):
+    """Write the eight subtets of every tet into a preallocated array."""
+    nelems = t.shape[1]
+    newt = np.empty((4, 8 * nelems), dtype=np.int64)
+    for itr in prange(nelems):
+        for b in range(4):
+            col = b * nelems + itr
+            newt[0, col] = t[b, itr]
+            for r in range(3):
+                newt[r + 1, col] = t2e[_CORNER_EDGES[b, r], itr]
+        c = case[itr]
+        for b in range(4):
+            col = caseoff[c] + b * casecount[c] + rank[itr]
+            for r in range(4):
+                newt[r, col] = t2e[_MIDDLE_EDGES[c, b, r], itr]
+    return newt
 
 
 @dataclass(repr=False)
@@ -90,24 +135,39 @@ class MeshTet1(Mesh3D):
 
         # splitting the pyramid in the middle;
         # diagonals are [2,4], [1,3] and [0,5]
-        newt = np.hstack((
-            np.vstack((t[0], t2e[0], t2e[2], t2e[3])),
-            np.vstack((t[1], t2e[0], t2e[1], t2e[4])),
-            np.vstack((t[2], t2e[1], t2e[2], t2e[5])),
-            np.vstack((t[3], t2e[3], t2e[4], t2e[5])),
-            np.vstack((t2e[2, c1], t2e[4, c1], t2e[0, c1], t2e[1, c1])),
-            np.vstack((t2e[2, c1], t2e[4, c1], t2e[0, c1], t2e[3, c1])),
-            np.vstack((t2e[2, c1], t2e[4, c1], t2e[1, c1], t2e[5, c1])),
-            np.vstack((t2e[2, c1], t2e[4, c1], t2e[3, c1], t2e[5, c1])),
-            np.vstack((t2e[1, c2], t2e[3, c2], t2e[0, c2], t2e[4, c2])),
-            np.vstack((t2e[1, c2], t2e[3, c2], t2e[4, c2], t2e[5, c2])),
-            np.vstack((t2e[1, c2], t2e[3, c2], t2e[5, c2], t2e[2, c2])),
-            np.vstack((t2e[1, c2], t2e[3, c2], t2e[2, c2], t2e[0, c2])),
-            np.vstack((t2e[0, c3], t2e[5, c3], t2e[1, c3], t2e[4, c3])),
-            np.vstack((t2e[0, c3], t2e[5, c3], t2e[4, c3], t2e[3, c3])),
-            np.vstack((t2e[0, c3], t2e[5, c3], t2e[3, c3], t2e[2, c3])),
-            np.vstack((t2e[0, c3], t2e[5, c3], t2e[2, c3], t2e[1, c3])),
-        ))
+        if HAS_NUMBA:
+            nelems = t.shape[1]
+            case = np.full(nelems, 2, dtype=np.int64)
+            case[c2] = 1
+            case[c1] = 0
+            casecount = np.array([np.sum(c1), np.sum(c2), np.sum(c3)],
+                                 dtype=np.int64)
+            caseoff = 4 * nelems + 4 * (np.cumsum(casecount) - casecount)
+            rank = np.empty(nelems, dtype=np.int64)
+            rank[c1] = np.arange(casecount[0], dtype=np.int64)
+            rank[c2] = np.arange(casecount[1], dtype=np.int64)
+            rank[c3] = np.arange(casecount[2], dtype=np.int64)
+            newt = _uniform_split(t, t2e, case, rank, caseoff, casecount)
+            return replace(
+                self,
+                doflocs=newp,
+                t=newt,
+                _boundaries=None,
+                _subdomains=None,
+            )
+
+        nelems = t.shape[1]
+        newt = np.empty((4, 8 * nelems), dtype=np.int64)
+        for b in range(4):
+            block = slice(b * nelems, (b + 1) * nelems)
+            newt[0, block] = t[b]
+            newt[1:, block] = t2e[_CORNER_EDGES[b]]
+        off = 4 * nelems
+        for c, cond in enumerate((c1, c2, c3)):
+            sub = t2e[:, cond]
+            for b in range(4):
+                newt[:, off:(off + sub.shape[1])] = sub[_MIDDLE_EDGES[c, b]]
+                off += sub.shape[1]
 
         return replace(
             self,
@@ -7,6 +7,47 @@ from scipy.spatial import cKDTree
 
 from ..element import Element, ElementTriP1
 from .mesh_2d import Mesh2D
+from ._topology import HAS_NUMBA, njit
+
+
+@njit('int64[:, ::1](float64[:, ::1], int64[:, ::1])', cache=True)
+def _sort_elements(p, t):
+    """Make (0, 2) the longest edge in t, one element at a time."""
+    for itr in range(t.shape[1]):
+        t0, t1, t2 = t[0, itr], t[1, itr], t[2, itr]
+        l01 = 0.
+        l12 = 0.
+        l02 = 0.
+        for d in range(p.shape[0]):
+            l01 += (p[d, t0] - p[d, t1]) ** 2
+            l12 += (p[d, t1] - p[d, t2]) ** 2
+            l02 += (p[d, t0] - p[d, t2]) ** 2
+        if l01 > l02 and l01 > l12:
+            t[1, itr] = t2
+            t[2, itr] = t1
+        elif l12 > l01 and l12 > l02:
+            t[0, itr] = t1
+            t[1, itr] = t0
+    return t
+
+
+@njit('int64[::1](int64[:, ::1], int64, int64[::1])', cache=True)
+def _find_split_facets(t2f, nfacets, marked):
+    """Mark facets for splitting until the mesh is conforming."""
+    facets = np.zeros(nfacets, dtype=np.int64)
+    for e in marked:
+        facets[t2f[0, e]] = 1
+        facets[t2f[1, e]] = 1
+        facets[t2f[2, e]] = 1
+    changed = True
+    while changed:
+        changed = False
+        for e in range(t2f.shape[1]):
+            if (facets[t2f[0, e]] + facets[t2f[1, e]] > 0
+                    and facets[t2f[2, e]] == 0):
+                facets[t2f[2, e]] = 1
+                changed = True
+    return facets
 
 
 @dataclass(repr=False)
@@ -219,6 +260,9 @@ class MeshTri1(Mesh2D):
     @staticmethod
     def _adaptive_sort_mesh(p, t):
         """Make (0, 2) the longest edge in t."""
+        if HAS_NUMBA:
+            return _sort_elements(p, t)
+
         l01 = np.sqrt(np.sum((p[:, t[0]] - p[:, t[1]]) ** 2, axis=0))
         l12 = np.sqrt(np.sum((p[:, t[1]] - p[:, t[2]]) ** 2, axis=0))
         l02 = np.sqrt(np.sum((p[:, t[0]] - p[:, t[2]]) ** 2, axis=0))
@@ -240,6 +284,15 @@ class MeshTri1(Mesh2D):
     @staticmethod
     def _adaptive_find_facets(m, marked_elems):
         """Find the facets to split."""
+        marked_elems = np.asarray(marked_elems)
+        if marked_elems.dtype == np.bool_:
+            marked_elems = np.flatnonzero(marked_elems)
+        if HAS_NUMBA:
+            return _find_split_facets(m.t2f,
+                                      m.facets.shape[1],
+                                      np.ascontiguousarray(marked_elems,
+                                                           dtype=np.int64))
+
         facets = np.zeros(m.facets.shape[1], dtype=np.int64)
         facets[m.t2f[:, marked_elems].flatten('F')] = 1
         prev_nnz = -1e10
@@ -526,3 +526,23 @@ def test_init_refdom(mtype):
     mapping = m._mapping()
     x = mapping.F(m.p)[:, 0, :]
     assert_array_equal(x, m.p)
+
+
+@pytest.mark.parametrize(
+    "mtype",
+    [
+        MeshTri,
+        MeshQuad,
+        MeshHex,
+        MeshTet,
+        MeshLine,
+    ]
+)
+def test_default_mesh_not_shared(mtype):
+
+    m = mtype()
+    m.p[0, 0] = -1.
+    m.t[0, 0] = m.t[-1, 0]
+    M = mtype()
+    assert M.p[0, 0] == 0.
+    assert M.t[0, 0] == 0